@@ -35,7 +35,7 @@ from __future__ import annotations
 
 import re
 import pickle
-from functools import singledispatch
+from functools import lru_cache, singledispatch
 import tempfile
 from abc import ABCMeta, abstractmethod
 from contextlib import contextmanager
@@ -44,7 +44,7 @@ from inspect import Parameter, signature
 from io import BytesIO  # noqa
 from pathlib import Path
 from string import Template
-from typing import TYPE_CHECKING, Any, Callable, Dict, Union, Optional, List
+from typing import TYPE_CHECKING, Any, Callable, Dict, Tuple, Union, Optional
 from urllib.parse import urlparse
 
 
@@ -71,6 +71,42 @@ if TYPE_CHECKING:
 #############################################################################
 
 
+@singledispatch
+def _rec_eval(value):
+    """
+    Recursively evaluate the litteral strings of 'value'.
+    """
+
+    return value
+
+
+@_rec_eval.register(str)
+def _(value):
+    """
+    Evaluate a litteral string
+    """
+
+    try:
+        return _rec_eval(eval(value, {}))
+    except BaseException:
+        return value
+
+
+@_rec_eval.register(dict)
+def _(value):
+    return {key: _rec_eval(value[key]) for key in value}
+
+
+@_rec_eval.register(list)
+def _(value):
+    return [_rec_eval(value[key]) for key in value]
+
+
+@_rec_eval.register(type(None))
+def _(_):
+    return None
+
+
 class DynamicInterpolation(Template):
     """
     Implements the interpolation of the !{} for the artifact values.
@@ -91,6 +127,28 @@ class DynamicInterpolation(Template):
     """  # type: ignore
 
 
+@lru_cache(maxsize=1024)
+def _compile_interpolation(string: str) -> Optional[Tuple[Union[str, Tuple[str]], ...]]:
+    """
+    Split a DynamicInterpolation template into a plan of literal strings and (name,) placeholders, to be rendered with a single join.
+    Return None if the template contains an invalid placeholder, for the error to be raised by the Template itself.
+    """
+
+    plan = []
+    cursor = 0
+    for match in DynamicInterpolation.pattern.finditer(string):  # type: ignore
+        if match.group("invalid") is not None:
+            return None
+
+        plan.append(string[cursor : match.start()])
+        name = match.group("named") or match.group("braced")
+        plan.append((name,) if name else DynamicInterpolation.delimiter)
+        cursor = match.end()
+    plan.append(string[cursor:])
+
+    return tuple(part for part in plan if part)
+
+
 class MixinParseInterpolate:
     """
     Implements helpers to interpolate a string and potentialy parse-it
@@ -119,40 +177,14 @@ class MixinParseInterpolate:
         Evaluate a given string using the provided context
         """
 
-        @singledispatch
-        def rec_eval(value):
-            return value
-
-        @rec_eval.register(str)
-        def _(value):
-            """
-            Evaluate a litteral string
-            """
-
-            try:
-                return rec_eval(eval(value, {}))
-            except BaseException:
-                return value
-
-        @rec_eval.register(dict)
-        def _(value):
-            return {key: rec_eval(value[key]) for key in value}
-
-        @rec_eval.register(list)
-        def _(value):
-            return [rec_eval(value[key]) for key in value]
-
-        @rec_eval.register(type(None))
-        def _(_):
-            return None
-
-        def eval_(value):
-            return rec_eval(eval(value, {}))
+        # Without the +{ }+ markers, there is nothing to be evaluated
+        if "+{" not in string:
+            return string
 
         match = MixinParseInterpolate.pattern.match(string)
         if match:
             group = match.group(1)
-            out = eval_(group)
+            out = _rec_eval(eval(group, {}))
         else:
             out = string
 
@@ -166,8 +198,16 @@ class MixinParseInterpolate:
         if not string:
             raise Errors.E027()  # type: ignore
 
+        # Without the delimiter, there is nothing to be interpolated
+        if DynamicInterpolation.delimiter not in string:
+            return string
+
+        plan = _compile_interpolation(string)
         try:
-            string = DynamicInterpolation(string).substitute(**kwargs)
+            if plan is None:
+                string = DynamicInterpolation(string).substitute(**kwargs)
+            else:
+                string = "".join(part if isinstance(part, str) else str(kwargs[part[0]]) for part in plan)
         except KeyError as err:
             raise Errors.E028(trg=string) from err  # type: ignore
 
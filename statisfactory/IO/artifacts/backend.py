@@ -42,8 +42,6 @@ from typing import TYPE_CHECKING, Dict, Type
 from urllib.parse import ParseResult
 from warnings import warn
 
-from lakefs_client import models  # type: ignore
-
 from statisfactory.errors import Errors, Warnings
 from statisfactory.logger import MixinLogable, get_module_logger
 
@@ -286,6 +284,8 @@ class LakeFSBackend(Backend, prefix="lakefs"):
         Create a new Lake FS branch if it does not already exists
         """
 
+        from lakefs_client import models  # type: ignore
+
         client = self._session.lakefs_client
         repo_name = self._session.lakefs_repo["name"]
 
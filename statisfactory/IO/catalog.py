@@ -32,8 +32,9 @@
 
 # system
 from __future__ import annotations  # noqa
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Mapping, Optional
 
 import pandas as pd
 
@@ -134,6 +135,28 @@ class Catalog(MixinLogable):
 
         return interactor.load(**context)
 
+    def load_many(
+        self, names: Iterable[str], context: Optional[Mapping[str, Any]] = None, *, max_workers: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Load several assets from the catalogue, concurrently.
+        The loads are I/O bound and are dispatched to a pool of threads. The same context is provided to every load.
+
+        Args:
+            names (Iterable[str]): the names of the artifacts to load.
+            context (Optional[Mapping[str, Any]]): an optional context, forwarded to each load as named arguments.
+            max_workers (Optional[int]): the maximum number of threads to use. Default to the ThreadPoolExecutor's default.
+
+        Returns:
+            Dict[str, Any]: a mapping of the artifacts names to the loaded assets.
+        """
+
+        names = list(names)
+        context = context or {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            assets = executor.map(lambda name: self.load(name, **context), names)
+
+            return dict(zip(names, assets))
+
     def save(self, name: str, asset: Any, **context):
         """Save the asset using the artifact name.
         A context can be provided through named variadic args.
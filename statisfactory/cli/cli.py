@@ -32,7 +32,6 @@
 #############################################################################
 
 # system
-from email.policy import default
 from pathlib import Path
 
 # third party
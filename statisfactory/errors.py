@@ -131,6 +131,7 @@ class Errors(metaclass=ExceptionFactory):
     E0182 = "ConfigParser : failed to read the '{path}'. Is the file a valid jinja2 template ?"
     E0183 = "ConfigParser : failed to render the '{path}' template with template variables '{vars}'."
     E0184 = "ConfigParser : failed deserialize the yaml representation '{repr}'."
+    E019 = "start-up : pipelines definition '{name}' is part of a circular reference."
 
     # FS interactors
     E020 = "data interactor : there is already an interactor named '{name}'"
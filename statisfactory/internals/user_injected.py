@@ -30,8 +30,10 @@
 #                                 Packages                                  #
 #############################################################################
 
+import os
 import sys
 from contextlib import contextmanager
+from threading import RLock
 from dataclasses import dataclass
 from typing import Type
 from importlib import import_module
@@ -71,6 +73,10 @@ class UserInjected(type):
 
     _cls_to_protype = dict()
 
+    # Map a (class name, root, pyproject's mtime) triplet to the already built instance, for the cached Sessions
+    _instances = dict()
+    _instances_lock = RLock()
+
     def __new__(cls, name, bases, namespace, **kwargs):
 
         prototype = kwargs.get("prototype", None)
@@ -84,16 +90,48 @@ class UserInjected(type):
 
         return super().__new__(cls, name, bases, namespace)
 
-    def __call__(cls, root_folder=None):
+    def __call__(cls, root_folder=None, cached: bool = False):
         """
         Return a new Session class type to be used to instanciate Sessions.
         The new class inherits from the user defined one (if provide.)
-        """
 
-        prototype = UserInjected._cls_to_protype[cls.__name__]
+        Args:
+            root_folder: the root of the project. Default to the closest parent folder containing a pyproject.toml.
+            cached (bool): whether to return the Session already built for this project, if any. Default to False.
+
+        Implementation details:
+        * With `cached=True`, instances are memoized against the root and the pyproject's modification time : the returned Session is shared, and does not reflect later edits of the catalog, settings or hooks. Use `clear_cache` to force a fresh instanciation.
+        """
 
         # Retrieve the location of the config file
-        root = Path(root_folder or get_path_to_target("pyproject.toml"))
+        root = Path(root_folder or get_path_to_target("pyproject.toml")).resolve()
+        if not cached:
+            return cls._build(root)
+
+        try:
+            mtime_ns = os.stat(root / "pyproject.toml").st_mtime_ns
+        except OSError:
+            mtime_ns = None
+
+        key = (cls.__name__, str(root), mtime_ns)
+        with UserInjected._instances_lock:
+            try:
+                return UserInjected._instances[key]
+            except KeyError:
+                pass
+
+            instance = cls._build(root)
+            if mtime_ns is not None:
+                UserInjected._instances[key] = instance
+
+        return instance
+
+    def _build(cls, root: Path):
+        """
+        Create the class inheriting from the factory, and instanciate it.
+        """
+
+        prototype = UserInjected._cls_to_protype[cls.__name__]
 
         # If no custom factory is defined, then return the base session.
         config = get_pyproject(root / "pyproject.toml")
@@ -112,4 +150,12 @@ class UserInjected(type):
 
         # Create a new class inheriting from the factory
         session_class = type(cls.__name__, (cls, factory), {})  # type: ignore
-        return super(UserInjected, session_class).__call__(root_folder=root_folder)  # type: ignore
+        return super(UserInjected, session_class).__call__(root_folder=root)  # type: ignore
+
+    def clear_cache(cls) -> None:
+        """
+        Drop the memoized instances, for the next call to build a new object.
+        """
+
+        with UserInjected._instances_lock:
+            UserInjected._instances.clear()
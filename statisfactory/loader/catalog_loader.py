@@ -48,6 +48,9 @@ def get_artifacts_mapping(path: Union[str, Path], session) -> Dict[str, Artifact
     """
     build the catalog data
 
+    Implementation details:
+    * The artifacts are deserialized through gen_as_model, which caches the parsed catalog files against their mtimes : each catalog still gets its own artifacts.
+
     Returns:
         CatalogData: A mapping of artifacts and connectors
     """
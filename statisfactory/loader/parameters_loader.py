@@ -31,7 +31,6 @@
 #############################################################################
 
 # system
-from collections import defaultdict
 from typing import Any, Union, Dict, Mapping, Iterable, Tuple
 from pathlib import Path
 from functools import reduce
@@ -54,16 +53,12 @@ def _merge_by_precedence(parameters_definitions: Iterable[Tuple[str, ParametersS
     Merge the parameters set by precedence (the lower the precedence, the higher the priority )
     """
 
-    # Build a dictionary of parameters sets, grouped by name
-    tmp = defaultdict(list)
+    # Keep, for each name, the first parameters set with the lowest precedence
+    out: Dict[str, ParametersSetDefinition] = {}
     for name, parameters in parameters_definitions:
-        tmp[name].append(parameters)
-
-    # Order each group by increasing precedence and take the first one
-    out = {}
-    for key in tmp.keys():
-        first = sorted(tmp[key], key=lambda x: x.precedence)[0]
-        out[key] = first
+        kept = out.get(name)
+        if kept is None or parameters.precedence < kept.precedence:
+            out[name] = parameters
 
     return out
 
@@ -30,25 +30,52 @@
 #                                 Packages                                  #
 #############################################################################
 
-
+import os
 from pathlib import Path
+from typing import Dict, Tuple
+
+from statisfactory.errors import Errors
 
 #############################################################################
 #                                  Script                                   #
 #############################################################################
 
 
+# Map a (folder, target) couple to the closest parent folder containing the target
+_TARGETS_ROOTS: Dict[Tuple[str, str], Path] = dict()
+
+
 def get_path_to_target(target: str) -> Path:
     """
     Retrieve the path to "target" file by executing a "fish pass ;)" from the location of the caller
+
+    Implementation details:
+    * Every folder traversed during the walk is mapped to the found root, so that any later lookup started from one of them (or from the same cwd) is a single dict hit.
     """
 
+    cwd = os.getcwd()
+    try:
+        return _TARGETS_ROOTS[(cwd, target)]
+    except KeyError:
+        pass
+
     # Retrieve the "statisfactory.yaml" file
-    root = Path("/")
-    trg = Path().resolve()
+    root = os.path.abspath(os.sep)
+    trg = os.path.realpath(cwd)
+    visited = [cwd]
     while True:
-        if (trg / target).exists():
-            return trg
-        trg = trg.parent
+        found = _TARGETS_ROOTS.get((trg, target))
+        if found is None and os.path.exists(os.path.join(trg, target)):
+            found = Path(trg)
+        if found is not None:
+            break
+
+        visited.append(trg)
+        trg = os.path.dirname(trg)
         if trg == root:
             raise Errors.E010(target=target)  # type: ignore
+
+    for folder in visited:
+        _TARGETS_ROOTS[(folder, target)] = found
+
+    return found
@@ -32,7 +32,7 @@
 
 # system
 from importlib import import_module
-from typing import Union, Dict, Mapping
+from typing import Any, Union, Dict, List, Mapping
 from pathlib import Path
 
 # project
@@ -47,34 +47,81 @@ from statisfactory.loader.yaml_utils import gen_as_model
 #############################################################################
 
 
-def _load_pipeline(name, definition: PipelineDefinition, raw: Mapping) -> Pipeline:
+def _import_craft(pip_name: str, target_name: str) -> Any:
+    """
+    Import the Craft referenced by its fully qualified name 'target_name'.
+    """
+
+    callable_, *modules = target_name.split(".")[::-1]
+    modules = modules[::-1]
+    try:
+
+        craft = getattr(
+            import_module(".".join(modules)),
+            callable_,
+        )
+    except ImportError as error:
+        raise Errors.E015(pip_name=pip_name, module=".".join(modules)) from error  # type: ignore
+    except AttributeError as error:
+        raise Errors.E017(
+            pip_name=pip_name,
+            module=".".join(modules),
+            craft_name=callable_,
+        ) from error  # type: ignore
+
+    return craft
+
+
+def _sort_definitions(adjacency: Mapping[str, List[str]]) -> List[str]:
+    """
+    Return the pipelines names in post-order : any sub-pipeline comes before the pipelines embedding it.
+
+    Raise:
+        Errors.E019: if the definitions contain a circular reference.
+    """
+
+    ordered = []
+    done: Dict[str, bool] = {}  # False while the node is being visited, True once it's ordered
+    for root in adjacency:
+        if root in done:
+            continue
+
+        done[root] = False
+        stack = [(root, iter(adjacency[root]))]
+        while stack:
+            name, children = stack[-1]
+            for child in children:
+                if child not in done:
+                    done[child] = False
+                    stack.append((child, iter(adjacency[child])))
+                    break
+                if not done[child]:
+                    raise Errors.E019(name=child)  # type: ignore
+            else:
+                stack.pop()
+                done[name] = True
+                ordered.append(name)
+
+    return ordered
+
+
+def _load_pipeline(name, definition: PipelineDefinition, built: Mapping[str, Pipeline], crafts: Dict[str, Any]) -> Pipeline:
+    """
+    Assemble a Pipeline from the already built sub-pipelines and the (memoized) imported Crafts.
+    """
 
     P = Pipeline(name=name, tags=definition.tags)  # By default, YAML pipelines are namespaced
     for target_name in definition.operators:  # type: ignore
 
-        # If the name is declared in raw -> then it's a pipeline to be built
-        is_pipeline = target_name in raw
-        if is_pipeline:
-            P = P + _load_pipeline(target_name, raw[target_name], raw)
+        # If the name is declared in the definitions -> then it's a pipeline, already built
+        if target_name in built:
+            P = P + built[target_name]
 
         # If not, then it's a Craft to be imported
         else:
-            callable_, *modules = target_name.split(".")[::-1]
-            modules = modules[::-1]
-            try:
-
-                craft = getattr(
-                    import_module(".".join(modules)),
-                    callable_,
-                )
-            except ImportError as error:
-                raise Errors.E015(pip_name=name, module=".".join(modules)) from error  # type: ignore
-            except AttributeError as error:
-                raise Errors.E017(
-                    pip_name=name,
-                    module=".".join(modules),
-                    craft_name=callable_,
-                ) from error  # type: ignore
+            craft = crafts.get(target_name)
+            if craft is None:
+                craft = crafts[target_name] = _import_craft(name, target_name)
 
             P = P + craft
 
@@ -96,9 +143,12 @@ def get_pipelines(path: Union[str, Path], session) -> Dict[str, Pipeline]:
     # Combine all the YAML
     mapper = {name: pipeline for name, pipeline in gen_as_model(path, PipelineDefinition, render_vars)}  # type: ignore
 
-    # Iterate over each Definition, and create the a Pipeline object.
-    loaded = {}
-    for name, definition in mapper.items():
-        loaded[name] = _load_pipeline(name, definition, mapper)  # type: ignore
+    # Map each definition to the sub-pipelines it embeds, and order them so that each sub-pipeline is built only once.
+    adjacency = {name: [op for op in definition.operators if op in mapper] for name, definition in mapper.items()}  # type: ignore
+
+    built: Dict[str, Pipeline] = {}
+    crafts: Dict[str, Any] = {}
+    for name in _sort_definitions(adjacency):
+        built[name] = _load_pipeline(name, mapper[name], built, crafts)  # type: ignore
 
-    return loaded
+    return {name: built[name] for name in mapper}
@@ -31,10 +31,15 @@
 #############################################################################
 
 # system
+from functools import lru_cache
 from typing import Union
 from pydantic import ValidationError
 from pathlib import Path
-import tomli
+
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python < 3.11
+    import tomli as tomllib
 
 # project
 from statisfactory.models.models import Pyproject
@@ -45,17 +50,17 @@ from statisfactory.errors import Errors
 #############################################################################
 
 
-def get_pyproject(path: Union[str, Path]) -> Pyproject:
+@lru_cache(maxsize=32)
+def _load_pyproject(path: str, mtime_ns: int) -> Pyproject:
     """
-    Open and validate the statisfactory section of the pyproject.toml file
+    Parse and validate the statisfactory section of the pyproject.toml located at 'path'.
+    The modification time is part of the cache key, so that an edited file is parsed again.
     """
 
-    path = Path(path)
-
     # Extract the stati section from the pyproject
     try:
         with open(path, "rb") as f:
-            pyproject_toml = tomli.load(f)
+            pyproject_toml = tomllib.load(f)
             config = pyproject_toml.get("tool", {}).get("statisfactory", {})
     except BaseException as error:
         raise Errors.E012(path=path) from error  # type: ignore
@@ -67,3 +72,18 @@ def get_pyproject(path: Union[str, Path]) -> Pyproject:
         raise Errors.E011() from error  # type: ignore
 
     return config
+
+
+def get_pyproject(path: Union[str, Path]) -> Pyproject:
+    """
+    Open and validate the statisfactory section of the pyproject.toml file
+    """
+
+    path = Path(path)
+
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError as error:
+        raise Errors.E012(path=path) from error  # type: ignore
+
+    return _load_pyproject(str(path), mtime_ns)
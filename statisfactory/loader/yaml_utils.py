@@ -31,11 +31,14 @@
 #############################################################################
 
 # system
+import os
+import pickle
+from collections import OrderedDict
 from typing import Any, Dict, Iterator, Mapping, Optional, Union, Generator, Tuple, List
 from pathlib import Path
-from glob import glob
+from glob import iglob
 import yaml
-from functools import singledispatch
+from functools import lru_cache, singledispatch
 
 # Third party
 from jinja2 import Template
@@ -54,6 +57,73 @@ from statisfactory.models import PipelineDefinition, ParametersSetDefinition, Ar
 
 MODELS = Union[PipelineDefinition, ParametersSetDefinition, Artifact]
 
+# Use the libyaml-backed loader, when PyYAML has been compiled against it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _SafeLoader  # type: ignore
+
+# Delimiters of the Jinja's expressions, statements and comments
+_JINJA_MARKERS = ("{{", "{%", "{#")
+
+# Map the yamls files modification times and the render variables to the already rendered and parsed documents, pickled
+_DOCUMENTS_CACHE: "OrderedDict[Tuple[Any, ...], bytes]" = OrderedDict()
+_DOCUMENTS_CACHE_SIZE = 64
+
+
+@singledispatch
+def _replace_none(value):
+    """
+    Recursively replace the None of 'value' with 'null', for the None to be preserved once the yaml is rendered and parsed back.
+
+    Implementation details:
+    * YAML parse nill and ~ as None.
+    * YAML doesnt dump None as Null
+    * The render_vars dict is interpolate from global, so any null or ~ has been replaced by a None
+    * Before rendering, any None in the the render_vars dict replaced with a 'null'
+    * After rendering, and when parsed back, the None will be preserved
+    """
+
+    return value
+
+
+@_replace_none.register(dict)
+def _(value):
+    return {k: _replace_none(v) for k, v in value.items()}
+
+
+@_replace_none.register(list)
+def _(value):
+    return [_replace_none(v) for v in value]
+
+
+@_replace_none.register(type(None))
+def _(value):
+    return "null"
+
+
+@singledispatch
+def _freeze(value) -> Tuple[Any, ...]:
+    """
+    Recursively convert 'value' into a hashable key, tagged with the type of each node : {1: "x"} and {"1": "x"} get different keys.
+    Raise a TypeError if 'value' holds an unhashable leaf.
+    """
+
+    hash(value)
+
+    return (type(value), value)
+
+
+@_freeze.register(dict)
+def _(value):
+    return (dict, tuple((_freeze(k), _freeze(v)) for k, v in value.items()))
+
+
+@_freeze.register(list)
+@_freeze.register(tuple)
+def _(value):
+    return (type(value), tuple(_freeze(v) for v in value))
+
 
 def gen_as_model(
     path: Path, model: MODELS, render_vars: Optional[Dict[str, Any]] = None
@@ -66,19 +136,52 @@ def gen_as_model(
         render_vars (Dict[str, Any]): an optional mapping of variables to use to render the templates. Default to None.
     Returns
         Iterator[Dict[str, Any]]: a tuple of parsed dictionaries. One for each one of the yaml found in 'path'
+
+    Implementation details:
+    * The rendered and parsed documents are cached against the (path, mtime_ns) of every yaml file and the type-tagged rendering variables : unchanged files are only rendered and parsed once.
+    * The documents are cached pickled : unpickling hands fresh objects to each call, at a fraction of the cost of a deepcopy, and the models are built from them.
     """
 
-    render_vars = render_vars or {}
-    for template_path in _gen_yamls(Path(path)):
-        rendered = _render_template(template_path, render_vars)
+    path = Path(path)
+    files = tuple((str(p), os.stat(p).st_mtime_ns) for p in _gen_yamls(path))
+    try:
+        key = (str(path.resolve()), files, _freeze(render_vars))
+    except TypeError:
+        # Rendering variables that can't be keyed are not cached
+        yield from ((name, model(**val)) for name, val in _parse_documents(files, render_vars))  # type: ignore
+        return
+
+    try:
+        _DOCUMENTS_CACHE.move_to_end(key)
+        payload = _DOCUMENTS_CACHE[key]
+    except KeyError:
+        payload = _DOCUMENTS_CACHE[key] = pickle.dumps(tuple(_parse_documents(files, render_vars)))
+        if len(_DOCUMENTS_CACHE) > _DOCUMENTS_CACHE_SIZE:
+            _DOCUMENTS_CACHE.popitem(last=False)
+
+    for name, val in pickle.loads(payload):
+        yield name, model(**val)  # type: ignore
+
+
+def _parse_documents(
+    files: Tuple[Tuple[str, int], ...], render_vars: Optional[Dict[str, Any]] = None
+) -> Iterator[Tuple[Optional[str], Dict[str, Any]]]:
+    """
+    Render and parse each one of the 'files', and iterate over the (name, mapping) documents they define.
+    """
+
+    # Replace the None from renders_vars once, for all the templates
+    render_vars = _replace_none(render_vars or {})
+    for template_path, _ in files:
+        rendered = _render_template(Path(template_path), render_vars)
         templated = _load_template(rendered)
 
         if isinstance(templated, dict):
             for key, val in templated.items():
-                yield key, model(**val)  # type: ignore
+                yield key, val
         elif isinstance(templated, list):
             for val in templated:
-                yield None, model(**val)  # type: ignore
+                yield None, val
 
 
 def _load_template(template: str) -> Union[List, Dict[str, Any]]:
@@ -93,55 +196,44 @@ def _load_template(template: str) -> Union[List, Dict[str, Any]]:
     """
 
     try:
-        parsed = yaml.safe_load(template)  # type: ignore
+        parsed = yaml.load(template, Loader=_SafeLoader)  # type: ignore
     except BaseException as error:
         raise Errors.E0184(repr=template) from error  # type: ignore
 
     return parsed
 
 
+@lru_cache(maxsize=64)
+def _compile_template(raw: str) -> Template:
+    """
+    Compile a Jinja2 template. Templates are cached against their source, to be compiled once per process.
+    """
+
+    return Template(raw)
+
+
 def _render_template(path: Path, render_vars: Optional[Dict[str, Any]] = None) -> str:
     """
     Render the Jinja2 template from 'path' with  interpolated varaibles from 'render_vars'.
 
     Args:
         path (Path): the path to the ressource to render.
-        render_vars (Dict[str, Any], optional): An optional mapping of variables to use to render the template. Defaults to None.
-
-    Implementation details:
-    * YAML parse nill and ~ as None.
-    * YAML doesnt dump None as Null
-    * The render_vars dict is interpolate from global, so any null or ~ has been replaced by a None
-    * Before rendering, any None in the the render_vars dict replaced with a '~'
-    * After rendering, and when parsed back, the None will be preserved
+        render_vars (Dict[str, Any], optional): An optional mapping of variables to use to render the template, with None already replaced. Defaults to None.
     """
 
-    @singledispatch
-    def replace_none(value):
-        return value
-
-    @replace_none.register(dict)
-    def _(value):
-        return {k: replace_none(v) for k, v in value.items()}
-
-    @replace_none.register(list)
-    def _(value):
-        return [replace_none(v) for v in value]
-
-    @replace_none.register(type(None))
-    def _(value):
-        return "null"
-
     # Load and render the Jinja template
     try:
         with open(path) as f:
-            template = Template(f.read())
+            raw = f.read()
+
+        # A file without any Jinja markup renders to itself
+        if not any(marker in raw for marker in _JINJA_MARKERS):
+            return raw
+
+        template = _compile_template(raw)
     except BaseException as error:
         raise Errors.E0182(path=str(path)) from error  # type: ignore
 
-    # Replace the None from renders_vars with '~' because of the way yaml parse the None
-    render_vars = replace_none(render_vars)
-
     try:
         rendered = template.render(render_vars)
     except BaseException as error:
@@ -169,7 +261,7 @@ def _gen_yamls(path: Path) -> Iterator[Path]:
         yield path
     else:
         for files in (path / "**/*.yml", path / "**/*.yaml"):
-            for item in (Path(g) for g in glob(str(files), recursive=True)):
+            for item in (Path(g) for g in iglob(str(files), recursive=True)):
                 yield item
 
     return None
@@ -37,8 +37,6 @@ from inspect import Parameter, Signature, signature
 from typing import Any, Callable, Dict, List, Mapping, Tuple, Union  # , TYPE_CHECKING
 from warnings import warn
 
-from numpy import empty
-
 # project
 from statisfactory.errors import Errors, Warnings
 from statisfactory.models.models import Artifact, Volatile
@@ -250,9 +248,13 @@ class _Craft(Scoped, MixinHookable, MergeableInterface, MixinLogable):
         Implements the shallow copy protocol for the Craft.
 
         Return a craft with a reference to a copied catalog, so that the context can be independtly updated.
+
+        Implementation details:
+        * The annotations parsed from the callable's signature are immutable tuples : they are shared with the copy instead of being parsed again.
         """
 
-        craft = _Craft(self._callable)
+        craft = _Craft.__new__(_Craft)
+        craft.__dict__.update(self.__dict__)
         return craft
 
     def _save_artifacts(self, *, output, **context) -> Union[Mapping, None]:
@@ -34,7 +34,7 @@
 from __future__ import annotations  # noqa
 
 from copy import copy
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping
 
 from statisfactory.errors import Errors
 from statisfactory.logger import MixinLogable
@@ -72,7 +72,7 @@ class Runner(MixinLogable):
 
     def _update_volatiles(self, accumulated: Dict[str, Any], craft: _Craft, craft_output: Iterable[Any]) -> Dict[str, Any]:
         """
-        Return a new Volatile mapping, from the union of the current `accumulated` mapping with the volatiles extracted from a craft.
+        Update the `accumulated` Volatile mapping with the volatiles extracted from a craft, and return it.
         Raise an error if keys collides.
         """
 
@@ -84,7 +84,7 @@ class Runner(MixinLogable):
 
         # Merge the accumulated with the output
         try:
-            updated = merge_dictionaries(accumulated, update)
+            updated = merge_dictionaries(accumulated, update, inplace=True)
         except KeyError as error:
             raise Errors.E052(name=craft.name, kind="volatile") from error  # type: ignore
 
@@ -110,12 +110,12 @@ class Runner(MixinLogable):
             Dict[str, Any]: the final transient state resultuing from the craft application
         """
 
-        # Extract the FQN of the pipeline's craft
-        crafts_full_names = set()
+        # Solve the DAG once, and extract the FQN of the pipeline's craft
+        steps = []
         for craft in self:
             craft_module = craft.__module__ if craft.__module__ != "__main__" else None
-            craft_full_name = ".".join(filter(None, (craft_module, craft.name)))
-            crafts_full_names.add(craft_full_name)
+            steps.append((craft, ".".join(filter(None, (craft_module, craft.name)))))
+        crafts_full_names = {craft_full_name for _, craft_full_name in steps}
 
         # Split the Kwargs between shared and namespaced
         namespaced = {k: v for k, v in kwargs.items() if k in crafts_full_names}
@@ -128,11 +128,8 @@ class Runner(MixinLogable):
         cursor = 1
 
         # Iterate over the craft and accumulate the States
-        for craft in self:
+        for craft, craft_full_name in steps:
             self.info(f"running craft '{craft.name}'.")
-            craft_module = craft.__module__ if craft.__module__ != "__main__" else None
-            craft_full_name = ".".join(filter(None, (craft_module, craft.name)))
-
             craft_namespaced_context = namespaced.get(craft_full_name, {})
             if not isinstance(craft_namespaced_context, (Mapping)):
                 raise Errors.E055(got=str(type(craft_namespaced_context)))  # type: ignore
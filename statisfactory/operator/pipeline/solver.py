@@ -145,13 +145,13 @@ class DAGSolver(Solver):
 
         G = self._build_diGraph()
 
-        indegree_map = {v: d for v, d in G.in_degree() if d > 0}  # type: ignore
-        zero_indegree = [v for v, d in G.in_degree() if d == 0]  # type: ignore
+        indegree_map = dict(G.in_degree())  # type: ignore
+        zero_indegree = [v for v, d in indegree_map.items() if d == 0]
         while zero_indegree:
             yield (self._name_to_craft[c] for c in zero_indegree)
             new_zero_indegree = []
             for v in zero_indegree:
-                for _, child in G.edges(v):  # type: ignore
+                for child in G.successors(v):  # type: ignore
                     indegree_map[child] -= 1
                     if not indegree_map[child]:
                         new_zero_indegree.append(child)
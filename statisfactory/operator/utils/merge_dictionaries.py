@@ -42,26 +42,36 @@ from statisfactory.errors import Warnings
 #############################################################################
 
 
-def merge_dictionaries(left: Dict, right: Dict, strict=True) -> Dict:
+def merge_dictionaries(left: Dict, right: Dict, strict=True, inplace=False) -> Dict:
     """
     Return a new dictionary by merging Left and Right dictionaries together.
     Raise a KeyError if strict is True and keys collides.
+    If inplace is True, Left is updated and returned instead of being copied : the caller must own Left.
     """
 
     # Prevents dealing with one dict or two being None
-    left = left or {}
+    left = left if left is not None else {}
     right = right or {}
 
-    colliding_keys = set(left.keys()).intersection(set(right.keys()))
-    is_collision = len(colliding_keys) > 0
+    # Nothing can collide if one side is empty. Keys views are intersected without materializing the sets of keys
+    if left and right:
+        colliding_keys = left.keys() & right.keys()
 
-    if is_collision and strict:
-        raise KeyError(f"Colliding keys : {', '.join(colliding_keys)}")
+        if colliding_keys:
+            keys = ", ".join(colliding_keys)
+            if strict:
+                raise KeyError(f"Colliding keys : {keys}")
 
-    if is_collision:
-        warn(Warnings.W050.format(keys=", ".join(colliding_keys)))  # type: ignore
+            warn(Warnings.W050.format(keys=keys))  # type: ignore
 
-    return {**left, **right}
+    if inplace:
+        left.update(right)
+        return left
+
+    merged = dict(left)
+    merged.update(right)
+
+    return merged
 
 
 #############################################################################
@@ -31,24 +31,19 @@
 #                                 Packages                                  #
 #############################################################################
 
-import glob
+from __future__ import annotations  # noqa
+
 import os
 import sys
 from collections import defaultdict
+from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Mapping, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
 from warnings import warn
 from types import SimpleNamespace
 
-import boto3
-from dynaconf import Dynaconf, Validator
-from lakefs_client import ApiClient, Configuration, models
-from lakefs_client.api import repositories_api
-from lakefs_client.client import LakeFSClient
-from pygit2 import Repository
-
 from statisfactory.errors import Errors, Warnings
-from statisfactory.IO import Catalog
 from statisfactory.logger import MixinLogable, get_module_logger
 from statisfactory.operator import Scoped
 from statisfactory.loader import (
@@ -58,10 +53,55 @@ from statisfactory.loader import (
     get_pyproject,
 )
 
+# Project type checks : see PEP563. Dynaconf, the Catalog and the AWS, LakeFS and Git clients are imported when used.
+if TYPE_CHECKING:
+    import boto3
+    from dynaconf import Dynaconf
+    from lakefs_client import models
+    from lakefs_client.client import LakeFSClient
+    from pygit2 import Repository
+
+    from statisfactory.IO import Catalog
+
 #############################################################################
 #                                  Script                                   #
 #############################################################################
 
+_LOGGER = get_module_logger(__name__)
+
+# The settings that must be defined once the pyproject is injected, and the defaults of the optional ones
+_MANDATORY_SETTINGS = ("configuration", "catalog", "project_slug")
+_SETTINGS_DEFAULTS = {"notebook_target": "jupyter", "lakefs_bucket": "s3://lakefs/"}
+
+
+def _get_dynaconf_environ() -> Tuple[Tuple[str, str], ...]:
+    """
+    Return the environment variables read by Dynaconf : the DYNACONF_ prefixed overrides and the *_FOR_DYNACONF switches.
+    """
+
+    return tuple(sorted((k, v) for k, v in os.environ.items() if k.startswith("DYNACONF_") or k.endswith("_FOR_DYNACONF")))
+
+
+@lru_cache(maxsize=32)
+def _load_settings_files(files: Tuple[Tuple[str, int], ...], environ: Tuple[Tuple[str, str], ...] = ()) -> Dict[str, Any]:
+    """
+    Parse the configuration files with Dynaconf, in the reversed preceding order (to allow for variables shadowing).
+    The parsed settings are cached against the files' paths and modification times, and the Dynaconf's environment variables.
+
+    Args:
+        files (Tuple[Tuple[str, int], ...]): the (path, mtime_ns) of the configuration files to load.
+        environ (Tuple[Tuple[str, str], ...]): the Dynaconf's environment variables, as returned by `_get_dynaconf_environ`. Only used as a cache key.
+    """
+
+    from dynaconf import Dynaconf
+
+    settings = Dynaconf(
+        settings_files=[path for path, _ in files],
+        load_dotenv=False,
+    )
+
+    return settings.as_dict()  # type: ignore
+
 
 class BaseSession(MixinLogable):
     """
@@ -82,37 +122,49 @@ class BaseSession(MixinLogable):
     * The class by itself does not do much, but delegates must of the work the the hooks.
     * The hooks can be used to develop plugins : such as an integration to mlflow, the instanciation of a Spark session.
     * The ``_`` attribute schould be used to store user defined custom extension
+    * Hooks are registered against a load point. The "init" hooks are executed at the instanciation, the others ("aws", "git", "lakefs") the first time the matching getter is called.
     """
 
-    _hooks = []
+    # Registered hooks, grouped by the load point they are fired at. Stored as tuples, rebuilt on each (rare) registration.
+    _hooks = defaultdict(tuple)
 
-    def __init__(self, *, root_folder: Optional[str] = None):
+    def __init__(self, *, root_folder: Optional[Union[str, os.PathLike]] = None):
         """
         Instanciate a Session by searching for the statisfactory.yaml file in the parent folders
         """
 
         super().__init__(logger_name=__name__)
 
-        # Retrieve the location of the config file
-        self._root = Path(root_folder or get_path_to_target("pyproject.toml"))
+        # Retrieve the location of the config file. The root is resolved once, so that the paths derived from it are absolute.
+        self._root = Path(root_folder or get_path_to_target("pyproject.toml")).resolve()
 
         self.info(f"Initiating Statisfactory to : '{self._root}'")
 
         # Extract the stati section from the pyproject
         config = get_pyproject(self._root / "pyproject.toml")
 
-        # Prepare an empty Dynaconf object and inject the config from pyproject
-        self._settings = Dynaconf()
-        self._settings.update(config.dict())  # type: ignore
+        pyproject = config.dict()
+
+        from dynaconf import Dynaconf
+
+        # Build the Dynaconf object from the (cached) globals / locals files
+        configuration = os.path.join(str(self._root), str(pyproject.get("configuration", "")))
+        files = tuple((path, os.stat(path).st_mtime_ns) for path in self._get_settings_files(configuration))
+        self._settings = Dynaconf(load_dotenv=False)
+        self._settings.update(deepcopy(_load_settings_files(files, _get_dynaconf_environ())))  # type: ignore
 
-        self._settings.validators.register(  # type: ignore
-            Validator("configuration", "catalog", must_exist=True),
-            Validator("notebook_target", default="jupyter"),
-            Validator("project_slug", must_exist=True),
-        )  # type: ignore
+        # Inject the config from pyproject, without shadowing the values from the configuration files
+        for key, value in pyproject.items():
+            if key not in self._settings:
+                self._settings.set(key, value)  # type: ignore
 
-        # Fire up the validators
-        self._settings.validators.validate()  # type: ignore
+        # Check the mandatory settings and fill in the defaults, without going through the Dynaconf validators
+        if any(key not in self._settings for key in _MANDATORY_SETTINGS):
+            raise Errors.E011()  # type: ignore
+
+        for key, value in _SETTINGS_DEFAULTS.items():
+            if key not in self._settings:
+                self._settings.set(key, value)  # type: ignore
 
         # Instanciate the 'user space'
         self._ = SimpleNamespace()
@@ -126,9 +178,9 @@ class BaseSession(MixinLogable):
         self._lakefs_repo: Optional[models.RepositoryCreation] = None
         self._git: Optional[Repository] = None
 
-        # Execute any registered hooks
-        for h in BaseSession._hooks:
-            h(self)
+        # Execute any registered hooks. Other load points are fired on demand.
+        self._loaded = set()
+        self._run_load_hooks("init")
 
         self.info("All done ! You are ready to go ! \U00002728 \U0001F370 \U00002728")
 
@@ -195,6 +247,7 @@ class BaseSession(MixinLogable):
             boto3.Session: The session configured via the initiaition hook.
         """
 
+        self._run_load_hooks("aws")
         if not self._aws_session:
             raise Errors.E062()  # type: ignore
 
@@ -206,6 +259,7 @@ class BaseSession(MixinLogable):
         Getter for the Git repository the session belongs to.
         """
 
+        self._run_load_hooks("git")
         if not self._git:
             raise Errors.E064()  # type: ignore
 
@@ -219,6 +273,7 @@ class BaseSession(MixinLogable):
             The lakeFS configured via the initiaition hook.
         """
 
+        self._run_load_hooks("lakefs")
         if not self._lakefs_client:
             raise Errors.E063()  # type: ignore
 
@@ -230,25 +285,82 @@ class BaseSession(MixinLogable):
         Return the LakeFS repository's pointer.
         """
 
+        self._run_load_hooks("lakefs")
         if not self._lakefs_repo:
             raise Errors.E063()  # type: ignore
 
         return self._lakefs_repo
 
+    def _get_path(self, key: str) -> str:
+        """
+        Return the absolute path of the 'key' setting, relative to the project's root.
+        The path is read from the merged settings, so that the configuration files and the hooks can override the pyproject.
+        """
+
+        return os.path.join(str(self._root), str(self.settings[key]))
+
+    def _get_settings_files(self, configuration: str) -> List[str]:
+        """
+        Fetch the globals / locals configuration files, in a single pass over the 'configuration' folder.
+        """
+
+        globals_files: List[str] = []
+        locals_files: List[str] = []
+        try:
+            with os.scandir(configuration) as entries:
+                for entry in entries:
+                    stem, extension = os.path.splitext(entry.name)
+                    if stem == "globals":
+                        bucket = globals_files
+                    elif stem == "locals":
+                        bucket = locals_files
+                    else:
+                        continue
+
+                    if extension in (".yml", ".yaml") and entry.is_file():
+                        bucket.append(entry.path)
+                        self.info(f"Adding '{stem}' to catalogs definitions.")
+        except FileNotFoundError:
+            pass
+
+        # Warn the user if a configuration target is missing
+        if not globals_files:
+            warn(Warnings.W011)  # type: ignore
+        if not locals_files:
+            warn(Warnings.W012)  # type: ignore
+
+        return globals_files + locals_files
+
+    def _run_load_hooks(self, load_point: str) -> None:
+        """
+        Execute, once per Session, the hooks registered against 'load_point'.
+        """
+
+        if load_point in self._loaded:
+            return
+
+        self._loaded.add(load_point)
+        hooks = BaseSession._hooks[load_point]
+        for h in hooks:
+            h(self)
+
     @classmethod
-    def hook_post_init(cls, last=True) -> Callable:
+    def hook_post_init(cls, last=True, load_point: str = "init") -> Callable:
         """
         Register a `callable_` to be executed after the session instanciation.
+
+        Args:
+            last (bool): Whether to append the hook after the already registered ones. Default to True.
+            load_point (str): The load point firing the hook. "init" hooks are run at the instanciation. Other load points ("aws", "git", "lakefs") are fired the first time the matching getter is called.
         """
 
         def _(callable_: Callable):
 
-            LOGGER = get_module_logger(__name__)
-            LOGGER.debug(f"Registering session's hook : '{callable_.__name__}'")
+            _LOGGER.debug("Registering session's '%s' hook : '%s'", load_point, callable_.__name__)
             if last:
-                cls._hooks.append(callable_)
+                cls._hooks[load_point] = cls._hooks[load_point] + (callable_,)
             else:
-                cls._hooks.insert(0, callable_)
+                cls._hooks[load_point] = (callable_,) + cls._hooks[load_point]
 
             return callable_
 
@@ -259,7 +371,7 @@ class _DefaultHooks:
     """
     Name spaces for the mandatory Session postinits hooks.
 
-    Hooks will be executed int the order they are declared.
+    Hooks will be executed int the order they are declared, when their load point is fired.
 
     Implementation details:
     * These hooks use the logger from the session, instead of cust
@@ -275,60 +387,20 @@ class _DefaultHooks:
         if "sources" not in sess.settings:
             return
 
-        src_path = (sess.root / str(sess.settings.sources)).resolve()
+        src_path = sess._get_path("sources")
 
         # Insert Lib into the Path
         if src_path not in sys.path:
-            sys.path.insert(0, str(src_path))
+            sys.path.insert(0, src_path)
             sess.info(f"adding '{sess.settings.sources}' to PATH")
 
         # Create / update the python path
-        try:
-            os.environ["PYTHONPATH"]
+        if "PYTHONPATH" in os.environ:
             warn(Warnings.W010)  # type: ignore
-        except KeyError:
-            os.environ["PYTHONPATH"] = str(src_path)
+        else:
+            os.environ["PYTHONPATH"] = src_path
             sess.info(f"setting PYTHONPATH to '{sess.settings.sources}'")
 
-    @staticmethod
-    @BaseSession.hook_post_init()
-    def set_settings(sess: BaseSession) -> None:
-        """
-        Parse the settings file from the conf/ folder and add the settings to the base statisfactory settings
-        """
-
-        # Warn the user if a configuration target is missing
-        targets = {
-            "globals": Warnings.W011,
-            "locals": Warnings.W012,
-        }
-
-        # fetch config file starting with locals / globals
-        base = sess.root / str(sess.settings.configuration)
-        types = (base / "*.yml", base / "*.yaml")
-        config_files = defaultdict(set)
-        for files in types:
-            for item in (Path(g) for g in glob.glob(str(files))):
-                if item.name.startswith("locals") or item.name.startswith("globals"):
-                    config_files[item.stem].add(str(item.resolve()))
-                    sess.info(f"Adding '{item.stem}' to catalogs definitions.")
-
-        for target, w in targets.items():
-            if not config_files[target]:
-                warn(w)
-
-        config_to_loads = list(config_files["globals"]) + list(config_files["locals"])
-        # Fetch all the config file, in the reversed preceding order (to allow for variables shadowing)
-        settings = Dynaconf(
-            validators=[
-                Validator("lakefs_bucket", default="s3://lakefs/"),
-            ],
-            settings_files=config_to_loads,
-            load_dotenv=False,
-        )
-
-        sess._settings.update(settings)  # type: ignore
-
     @staticmethod
     @BaseSession.hook_post_init()
     def set_catalog(sess: BaseSession) -> None:
@@ -336,8 +408,9 @@ class _DefaultHooks:
         Attach the catalog to the session
         """
 
-        path = sess.root / str(sess.settings.catalog)
-        catalog = Catalog(path=path, session=sess)
+        from statisfactory.IO import Catalog
+
+        catalog = Catalog(path=sess._get_path("catalog"), session=sess)  # type: ignore
 
         sess._catalog = catalog
 
@@ -352,7 +425,12 @@ class _DefaultHooks:
             sess.warn("No parameters to set up.")
             return
 
-        path = (sess.root / str(sess.settings.parameters)).resolve()
+        path = sess._get_path("parameters")
+        if not os.path.exists(path):
+            sess.warn(f"No parameters found at '{path}'.")
+            sess._parameters = {}
+            return
+
         parameters = get_parameters(path, sess)
 
         sess._parameters = parameters
@@ -368,14 +446,18 @@ class _DefaultHooks:
             sess.warn("No Pipelines definitions to set up.")
             return
 
-        path = (sess.root / str(sess.settings.pipelines_definitions)).resolve()
+        path = sess._get_path("pipelines_definitions")
+        if not os.path.exists(path):
+            sess.warn(f"No Pipelines definitions found at '{path}'.")
+            sess._pipelines_definitions = {}
+            return
 
         pipelines = get_pipelines(path, sess)
 
         sess._pipelines_definitions = pipelines
 
     @staticmethod
-    @BaseSession.hook_post_init()
+    @BaseSession.hook_post_init(load_point="aws")
     def set_AWS_client(sess: BaseSession) -> None:
         """
         Configure a Mamazon session.
@@ -384,6 +466,8 @@ class _DefaultHooks:
             sess (Session): The statisfactory session
         """
 
+        import boto3
+
         try:
             sess._aws_session = boto3.Session(
                 aws_access_key_id=sess.settings["aws_access_key"],
@@ -394,7 +478,7 @@ class _DefaultHooks:
             warn(Warnings.W060)
 
     @staticmethod
-    @BaseSession.hook_post_init()
+    @BaseSession.hook_post_init(load_point="git")
     def set_git_repo(sess: BaseSession) -> None:
         """
         Configure the Git client.
@@ -403,6 +487,8 @@ class _DefaultHooks:
             sess (Session): The statisfactory session updated by the hook
         """
 
+        from pygit2 import Repository
+
         # Find the Git repository the Session has been started in
         path_to_git = get_path_to_target(".git")
         repo = Repository(path_to_git)
@@ -411,7 +497,7 @@ class _DefaultHooks:
         return
 
     @staticmethod
-    @BaseSession.hook_post_init()
+    @BaseSession.hook_post_init(load_point="lakefs")
     def set_lakefs_client(sess: BaseSession) -> None:
         """
         Configure a lakefs client.
@@ -420,6 +506,11 @@ class _DefaultHooks:
             sess (Session): The statisfactory session updated by the hook
         """
 
+        from lakefs_client import ApiClient, Configuration, models
+        from lakefs_client.api import repositories_api
+        from lakefs_client.client import LakeFSClient
+        from lakefs_client.exceptions import ApiException
+
         # Create the configuration
         configuration = Configuration()
         try:
@@ -446,11 +537,13 @@ class _DefaultHooks:
         try:
             with ApiClient(configuration) as api_client:
                 api_instance = repositories_api.RepositoriesApi(api_client)
-                existing = api_instance.list_repositories()
-                existing = set([item.id for item in existing["results"]])
-                if slug in existing:
+                try:
+                    api_instance.get_repository(slug)
                     sess.debug(f"The LakeFS {slug} repo already exists.")
                     return
+                except ApiException as error:
+                    if error.status != 404:
+                        raise
 
                 # Create the repo
                 sess.info(f"Creating the LakeFS repository for {slug}")
@@ -30,23 +30,46 @@
 #                                 Packages                                  #
 #############################################################################
 
+import os
+import sys
+from collections import defaultdict
 import pytest
 from pathlib import Path
 from statisfactory import Session
+from statisfactory.session import BaseSession
+from statisfactory.errors import Errors
 
 #############################################################################
 #                                  Scripts                                  #
 #############################################################################
 
 
+# The test repository, resolved once
+_TEST_REPO = Path(__file__).parent.resolve() / "test_repo"
+
+
+def _make_repo(root: Path, pyproject: str = "", globals_: str = "") -> Path:
+    """
+    Write a minimal statisfactory project in 'root', with extra 'pyproject' lines and a 'globals_' configuration.
+    """
+
+    (root / "conf").mkdir()
+    (root / "pyproject.toml").write_text(
+        '[tool.statisfactory]\nproject_slug = "exemple"\nconfiguration = "conf"\ncatalog = "catalog.yaml"\n' + pyproject
+    )
+    (root / "conf" / "globals.yaml").write_text(globals_)
+    (root / "catalog.yaml").write_text("[]\n")
+
+    return root
+
+
 @pytest.fixture
 def sess():
     """
     Create a Stati session
     """
 
-    p = str(Path("tests/test_repo/").absolute())
-    sess = Session(root_folder=p)
+    sess = Session(root_folder=_TEST_REPO)
 
     return sess
 
@@ -59,3 +82,107 @@ def test_active_session(sess):
     with sess:
         sess_scoped = Session.get_active_session()
         assert sess_scoped is sess
+
+
+def test_lazy_load_points():
+    """
+    Check that the AWS hooks are only fired once the AWS session is requested.
+    """
+
+    sess = Session(root_folder=_TEST_REPO)
+    assert "aws" not in sess._loaded
+
+    with pytest.warns(UserWarning), pytest.raises(Errors.E062):  # type: ignore
+        sess.aws_session
+
+    assert "aws" in sess._loaded
+
+
+def test_session_memoized():
+    """
+    Check that a cached Session is only built once per project, until the cache is cleared.
+    """
+
+    sess = Session(root_folder=_TEST_REPO, cached=True)
+    assert Session(root_folder=_TEST_REPO, cached=True) is sess
+    assert Session(root_folder=str(_TEST_REPO), cached=True) is sess
+    assert Session(root_folder=_TEST_REPO) is not sess
+
+    Session.clear_cache()
+    assert Session(root_folder=_TEST_REPO, cached=True) is not sess
+
+
+def test_session_not_stale(tmp_path, monkeypatch):
+    """
+    Check that a new Session reflects the edited settings and the hooks registered after the first instanciation.
+    """
+
+    root = _make_repo(tmp_path, globals_="spam: 1\n")
+    assert Session(root_folder=root).settings.spam == 1
+
+    (root / "conf" / "globals.yaml").write_text("spam: 2\n")
+    os.utime(root / "conf" / "globals.yaml", ns=(0, 0))
+    assert Session(root_folder=root).settings.spam == 2
+
+    # Register the hook on a copy of the registry, for it not to leak into the other tests
+    monkeypatch.setattr(BaseSession, "_hooks", defaultdict(tuple, BaseSession._hooks))
+
+    @BaseSession.hook_post_init()
+    def late_hook(sess):
+        sess.late_hook_flag = 1
+
+    assert Session(root_folder=root).late_hook_flag == 1  # type: ignore
+
+
+def test_paths_from_settings(tmp_path):
+    """
+    Check that the paths defined in the configuration files are used by the hooks.
+    """
+
+    (tmp_path / "params").mkdir()
+    (tmp_path / "params" / "parameters.yaml").write_text("spam:\n  a: 1\n")
+    root = _make_repo(tmp_path, globals_="parameters: params\n")
+
+    sess = Session(root_folder=root)
+
+    assert sess.parameters["spam"]["a"] == 1
+
+
+def test_missing_paths(tmp_path):
+    """
+    Check that missing parameters and pipelines definitions folders result in empty mappings.
+    """
+
+    root = _make_repo(tmp_path, pyproject='parameters = "missing"\npipelines_definitions = "missing"\n')
+
+    sess = Session(root_folder=root)
+
+    assert sess.parameters == {}
+    assert sess.pipelines_definitions == {}
+
+
+def test_settings_environment_overrides(tmp_path, monkeypatch):
+    """
+    Check that the Dynaconf's environment variables are not shadowed by the settings cache.
+    """
+
+    root = _make_repo(tmp_path)
+
+    monkeypatch.setenv("DYNACONF_SPAM", "1")
+    assert Session(root_folder=root).settings.spam == 1
+
+    monkeypatch.setenv("DYNACONF_SPAM", "2")
+    assert Session(root_folder=root).settings.spam == 2
+
+
+def test_sources_added_to_path(monkeypatch):
+    """
+    Check that the sources folder is added back to the sys.path if it has been removed since a previous Session.
+    """
+
+    src_path = Session(root_folder=_TEST_REPO)._get_path("sources")
+    monkeypatch.setattr(sys, "path", [p for p in sys.path if p != src_path])
+
+    Session(root_folder=_TEST_REPO)
+
+    assert src_path in sys.path
@@ -30,6 +30,7 @@
 #                                 Packages                                  #
 #############################################################################
 
+from collections import OrderedDict
 from pathlib import Path
 
 import pytest
@@ -37,20 +38,48 @@ import pytest
 from statisfactory import Session, Catalog
 from statisfactory import Artifact
 from statisfactory.IO.artifacts import artifact_interactor
+from statisfactory.loader import yaml_utils
 
 #############################################################################
 #                                 Packages                                  #
 #############################################################################
 
+# The tests folder, resolved once
+_TESTS_ROOT = Path(__file__).parent.resolve()
 
-@pytest.fixture
+# The expected artifacts, validated once
+_TARGET_READ_CSV = Artifact(
+    name="test_read_csv",
+    type="csv",
+    extra={"path": "tests/test_repo/data/test_read_csv.csv"},
+    save_options={},
+    load_options={},
+)
+
+_TARGET_READ_CSV_2 = Artifact(
+    name="test_read_csv_2",
+    type="csv",
+    extra={"path": "tests/test_repo/data/test_read_csv.csv"},
+    save_options={},
+    load_options={},
+)
+
+_TARGET_DUMMY = Artifact(
+    name="dummy_artifact",
+    type="csv",
+    extra={"path": "tests/inteprolated/10_raw/!{dynamic}/test_read_csv.csv"},
+    save_options={},
+    load_options={},
+)
+
+
+@pytest.fixture(scope="module")
 def sess(request):
     """
     Prepare stati session
     """
 
-    p = str(Path(f"tests/{request.param}/").absolute())
-    sess = Session(root_folder=p)
+    sess = Session(root_folder=str(_TESTS_ROOT / request.param))
     return sess
 
 
@@ -63,16 +92,8 @@ def sess(request):
 )
 def test_check_existing_artifact(sess):
 
-    target = Artifact(
-        name="test_read_csv",
-        type="csv",
-        extra={"path": "tests/test_repo/data/test_read_csv.csv"},
-        save_options={},
-        load_options={},
-    )
-
     artifact = sess.catalog._get_artifact("test_read_csv")
-    assert target == artifact
+    assert _TARGET_READ_CSV == artifact
 
 
 @pytest.mark.parametrize(
@@ -84,16 +105,8 @@ def test_check_existing_artifact(sess):
 )
 def test_multiple_catalogs(sess):
 
-    target = Artifact(
-        name="test_read_csv_2",
-        type="csv",
-        extra={"path": "tests/test_repo/data/test_read_csv.csv"},
-        save_options={},
-        load_options={},
-    )
-
     artifact = sess.catalog._get_artifact("test_read_csv_2")
-    assert target == artifact
+    assert _TARGET_READ_CSV_2 == artifact
 
 
 @pytest.mark.parametrize(
@@ -108,84 +121,81 @@ def test_deeply_catalogs(sess):
     sess.catalog._get_artifact("deeply_nested")
 
 
-@pytest.mark.parametrize(
-    "sess",
-    [
-        "test_repo_catalog_jinja",
-    ],
-    indirect=True,
-)
-def test_jinja_interpolation(sess):
+def test_catalog_cached(monkeypatch):
+    """
+    An unchanged catalog is only parsed once, but each Session gets its own artifacts.
+    """
 
-    target = Artifact(
-        name="dummy_artifact",
-        type="csv",
-        extra={"path": "tests/inteprolated/10_raw/!{dynamic}/test_read_csv.csv"},
-        save_options={},
-        load_options={},
-    )
+    parsed = []
+    parse_documents = yaml_utils._parse_documents
 
-    artifact = sess.catalog._get_artifact("dummy_artifact")
+    def spy(files, render_vars=None):
+        parsed.append(files)
+        return parse_documents(files, render_vars)
 
-    assert target == artifact
+    monkeypatch.setattr(yaml_utils, "_DOCUMENTS_CACHE", OrderedDict())
+    monkeypatch.setattr(yaml_utils, "_parse_documents", spy)
+
+    first = Session(root_folder=_TESTS_ROOT / "test_repo_multiple")
+    second = Session(root_folder=_TESTS_ROOT / "test_repo_multiple")
+    catalog = first._get_path("catalog")
+
+    assert len([files for files in parsed if files[0][0].startswith(catalog)]) == 1
+    assert second.catalog._get_artifact("deeply_nested") == first.catalog._get_artifact("deeply_nested")
+    assert second.catalog._get_artifact("deeply_nested") is not first.catalog._get_artifact("deeply_nested")
 
 
 @pytest.mark.parametrize(
     "sess",
     [
-        "test_repo_catalog_jinja",
+        "test_repo_multiple",
     ],
     indirect=True,
 )
-def test_jinja_loop(sess):
+def test_catalog_artifacts_isolated(sess):
     """
-    Make sure the Jinja Loop is rendered
+    Mutating an artifact of a Catalog does not leak into the other Catalogs built from the same files.
     """
 
-    for item in ["foo", "bar", "spam"]:
-        sess.catalog._get_artifact(f"{item}_artifact")
+    other = Catalog(path=sess._get_path("catalog"), session=sess)
+    other._get_artifact("test_read_csv").extra["path"] = "spam"
+
+    assert sess.catalog._get_artifact("test_read_csv") == _TARGET_READ_CSV
+    assert Catalog(path=sess._get_path("catalog"), session=sess)._get_artifact("test_read_csv") == _TARGET_READ_CSV
 
 
 @pytest.mark.parametrize(
     "sess",
     [
-        "test_repo",
+        "test_repo_catalog_jinja",
     ],
     indirect=True,
 )
-def test_odbc_interactor(sess):
-    """
-    Make sure None port are properly handled
-    """
-
-    artifact_repr = sess.catalog._get_artifact("test_odbc")
-    interactor_factory = sess.catalog._get_interactor(artifact_repr)
+def test_jinja_interpolation(sess):
 
-    args = interactor_factory(artifact_repr, sess=sess)._connection_url.translate_connect_args()
+    artifact = sess.catalog._get_artifact("dummy_artifact")
 
-    assert args == {"host": "192.19.1.1", "database": "test", "username": "foobar", "password": "spam"}
+    assert _TARGET_DUMMY == artifact
 
 
 @pytest.mark.parametrize(
     "sess",
     [
-        "test_repo",
+        "test_repo_catalog_jinja",
     ],
     indirect=True,
 )
-def test_odbc_interactor_dynamic(sess):
+def test_jinja_loop(sess):
     """
-    Make sure None port are properly handled
+    Make sure the Jinja Loop is rendered
     """
 
-    artifact_repr = sess.catalog._get_artifact("test_odbc_dynamic")
-    interactor_factory = sess.catalog._get_interactor(artifact_repr)
+    for item in ["foo", "bar", "spam"]:
+        sess.catalog._get_artifact(f"{item}_artifact")
 
-    args = interactor_factory(artifact_repr, sess=sess, port=1234)._connection_url.translate_connect_args()
-    assert args == {"host": "192.19.1.1", "database": "test", "username": "foobar", "password": "spam", "port": 1234}
 
-    args = interactor_factory(artifact_repr, sess=sess, port=None)._connection_url.translate_connect_args()
-    assert args == {"host": "192.19.1.1", "database": "test", "username": "foobar", "password": "spam"}
+_ODBC_ARGS = {"host": "192.19.1.1", "database": "test", "username": "foobar", "password": "spam"}
+_ODBC_ARGS_PORT = {**_ODBC_ARGS, "port": 1234}
 
 
 @pytest.mark.parametrize(
@@ -195,46 +205,27 @@ def test_odbc_interactor_dynamic(sess):
     ],
     indirect=True,
 )
-def test_odbc_eval_mapper_selector(sess):
-    """
-    Check the chaining on static > dynamic interpolation
-    """
-    artifact_repr = sess.catalog._get_artifact("test_eval_interpolation_selector")
-    interactor_factory = sess.catalog._get_interactor(artifact_repr)
-    port_mapping = {"base": 1234, "alternate": 5678}
-    args = interactor_factory(artifact_repr, sess=sess, port_mapping=port_mapping)._connection_url.translate_connect_args()
-    assert args == {"host": "192.19.1.1", "database": "test", "username": "foobar", "password": "spam", "port": 1234}
-
-
 @pytest.mark.parametrize(
-    "sess",
+    "artifact_name, kwargs, expected",
     [
-        "test_repo",
+        # None port are properly handled
+        ("test_odbc", {}, _ODBC_ARGS),
+        ("test_odbc_dynamic", {"port": 1234}, _ODBC_ARGS_PORT),
+        ("test_odbc_dynamic", {"port": None}, _ODBC_ARGS),
+        # Chaining of the static > dynamic interpolation
+        ("test_eval_interpolation_selector", {"port_mapping": {"base": 1234, "alternate": 5678}}, _ODBC_ARGS_PORT),
+        ("test_eval_interpolation_mapper", {"selector": "base"}, _ODBC_ARGS_PORT),
+        ("test_eval_interpolation_mapper_null", {"selector": "base"}, _ODBC_ARGS),
     ],
-    indirect=True,
+    ids=["static", "dynamic_port", "dynamic_none_port", "eval_mapper_selector", "eval_selector_mapper", "eval_selector_mapper_null"],
 )
-def test_odbc_eval_selector_mapper(sess):
+def test_odbc_interactor(sess, artifact_name, kwargs, expected):
     """
-    Check the chaining on static > dynamic interpolation
+    Check the connection arguments built by the odbc interactor, from the static and dynamic interpolations.
     """
-    artifact_repr = sess.catalog._get_artifact("test_eval_interpolation_mapper")
-    interactor_factory = sess.catalog._get_interactor(artifact_repr)
-    args = interactor_factory(artifact_repr, sess=sess, selector="base")._connection_url.translate_connect_args()
-    assert args == {"host": "192.19.1.1", "database": "test", "username": "foobar", "password": "spam", "port": 1234}
-
 
-@pytest.mark.parametrize(
-    "sess",
-    [
-        "test_repo",
-    ],
-    indirect=True,
-)
-def test_odbc_eval_selector_mapper_null(sess):
-    """
-    Check the chaining on static > dynamic interpolation
-    """
-    artifact_repr = sess.catalog._get_artifact("test_eval_interpolation_mapper_null")
+    artifact_repr = sess.catalog._get_artifact(artifact_name)
     interactor_factory = sess.catalog._get_interactor(artifact_repr)
-    args = interactor_factory(artifact_repr, sess=sess, selector="base")._connection_url.translate_connect_args()
-    assert args == {"host": "192.19.1.1", "database": "test", "username": "foobar", "password": "spam"}
+
+    args = interactor_factory(artifact_repr, sess=sess, **kwargs)._connection_url.translate_connect_args()
+    assert args == expected
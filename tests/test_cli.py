@@ -30,47 +30,38 @@
 #                                 Packages                                  #
 #############################################################################
 
+import sys
+from collections import defaultdict
 from pathlib import Path
-from click.testing import CliRunner
 from statisfactory.cli import cli
+from statisfactory.session import BaseSession
 
 
 #############################################################################
 #                                 Packages                                  #
 #############################################################################
 
+# The cli test repository, resolved once
+_CLI_PATH = str((Path(__file__).parent / "test_cli").resolve())
 
-def test_run():
-    """
-    Check that the cli is actually running and registering the custom hooks.
-    """
-
-    # Prepare the command to be executed
-    path = Path("tests/test_cli").resolve().absolute()
-    args = ["-p", str(path), "run", "base"]
-
-    runner = CliRunner()
-    result = runner.invoke(cli, args)
 
-    assert result.exit_code == 0
-    assert "REGISTERING CUSTOM SESSION HOOK" in result.stdout
-
-    print(result)
-
-
-def test_run():
+def test_run(capsys, monkeypatch):
     """
     Check that the cli is actually running and registering the custom hooks.
     """
 
-    # Prepare the command to be executed
-    path = Path("tests/test_cli").resolve().absolute()
-    args = ["-p", str(path), "run", "base"]
+    # The side-effects test repository ships its own 'side' entrypoint : import this repository's one, and restore the previous state afterward
+    monkeypatch.setitem(sys.modules, "side", None)
+    monkeypatch.delitem(sys.modules, "side")
+    monkeypatch.setattr(BaseSession, "_hooks", defaultdict(tuple, BaseSession._hooks))
 
-    runner = CliRunner()
-    result = runner.invoke(cli, args)
+    # Prepare the command to be executed
+    args = ["-p", _CLI_PATH, "run", "base"]
 
-    assert result.exit_code == 0
-    assert "REGISTERING CUSTOM SESSION HOOK" in result.stdout
+    # Run the cli in-process : any error is propagated instead of being trapped into an exit code
+    try:
+        cli.main(args, standalone_mode=False)
+    except SystemExit as error:
+        assert error.code == 0
 
-    print(result)
+    assert "REGISTERING CUSTOM SESSION HOOK" in capsys.readouterr().out
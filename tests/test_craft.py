@@ -32,7 +32,6 @@
 
 from pathlib import Path
 
-import pandas as pd
 import pytest
 
 from statisfactory import Artifact, Craft, Session, Volatile
@@ -43,30 +42,43 @@ from statisfactory.operator import craft
 #                                 Packages                                  #
 #############################################################################
 
+# The test repository, resolved once
+_TEST_REPO = Path(__file__).parent.resolve() / "test_repo"
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def sess():
     """
     Create a Stati session
     """
 
-    p = str(Path("tests/test_repo/").absolute())
-    sess = Session(root_folder=p)
+    sess = Session(root_folder=_TEST_REPO)
 
     return sess
 
 
+@Craft()
+def _step_return_1() -> Volatile("out_1"):  # type: ignore
+    return 1
+
+
+@Craft()
+def _step_echo(val) -> Volatile("out_1"):  # type: ignore
+    return val
+
+
+@Craft()
+def _step_echo_default(val=5) -> Volatile("out_1"):  # type: ignore
+    return val
+
+
 def test_craft_no_args(sess):
     """
     Test the execution of a craft without arguments
     """
 
-    @Craft()
-    def step_1() -> Volatile("out_1"):  # type: ignore
-        return 1
-
     with sess:
-        out = step_1()
+        out = _step_return_1()
 
     assert out == 1
 
@@ -76,12 +88,8 @@ def test_craft_keyword_args(sess):
     Test the execution of a craft with a keyword arg
     """
 
-    @Craft()
-    def step_1(val) -> Volatile("out_1"):  # type: ignore
-        return val
-
     with sess:
-        out = step_1(val=3)
+        out = _step_echo(val=3)
 
     assert out == 3
 
@@ -91,12 +99,8 @@ def test_craft_default_keyword_args(sess):
     Test the execution of a craft with a default keyword arg
     """
 
-    @Craft()
-    def step_1(val=5) -> Volatile("out_1"):  # type: ignore
-        return val
-
     with sess:
-        out = step_1()
+        out = _step_echo_default()
 
     assert out == 5
 
@@ -106,12 +110,8 @@ def test_craft_default_keyword_precedence_args(sess):
     Test the execution of a craft with a default keyword arg and a provided value
     """
 
-    @Craft()
-    def step_1(val=5) -> Volatile("out_1"):  # type: ignore
-        return val
-
     with sess:
-        out = step_1(val=7)
+        out = _step_echo_default(val=7)
 
     assert out == 7
 
@@ -129,32 +129,31 @@ def test_variadic_artifact_interpolation_dispatching(sess):
         spam(variadic="data")
 
 
-@pytest.fixture
-def custom_sess():
+class ArgsHolderBackend(Backend, prefix="testargs"):
     """
-    Create a Stati session with a testable backend
+    Test the implementation of a custom, testable backend.
+
+    The Backend mutate two flags to notify the client of it's execution.
     """
 
-    # Define a testable backend
-    class TestableBackend(Backend, prefix="testargs"):
-        """
-        Test the implementation of a custom, testable backend.
+    def __init__(self, session):
+        super().__init__(session=session)
 
-        The Backend mutate two flags to notify the client of it's execution.
-        """
+    def put(self, *, payload, fragment, args_holder, **kwargs):
+        args_holder[0] = kwargs
 
-        def __init__(self, session):
-            super().__init__(session=session)
+    def get(self, *, fragment, args_holder, **kwargs):
+        args_holder[1] = kwargs
+        return b"1,2,3"
 
-        def put(self, *, payload, fragment, args_holder, **kwargs):
-            args_holder[0] = kwargs
 
-        def get(self, *, fragment, args_holder, **kwargs):
-            args_holder[1] = kwargs
-            return b"1,2,3"
+@pytest.fixture(scope="module")
+def custom_sess():
+    """
+    Create a Stati session with a testable backend
+    """
 
-    p = str(Path("tests/test_repo/").absolute())
-    sess = Session(root_folder=p)
+    sess = Session(root_folder=_TEST_REPO)
 
     return sess
 
@@ -170,6 +169,8 @@ def test_propagating_configuration_to_backend(custom_sess):
 
     @Craft()
     def spam() -> Artifact("test_custom_backend_args"):  # type: ignore
+        import pandas as pd
+
         return pd.DataFrame()
 
     args_holder = [None, None]
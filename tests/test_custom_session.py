@@ -30,45 +30,25 @@
 #                                 Packages                                  #
 #############################################################################
 
-import os
-import sys
-import pytest
 from pathlib import Path
-import sys
 
 #############################################################################
 #                                  Scripts                                  #
 #############################################################################
 
 
-@pytest.fixture
-def change_test_dir(request):
-    """
-    Change the working directory of the test
-    """
+# The test repository, resolved once
+_TEST_REPO = Path(__file__).parent.resolve() / "test_custom_session"
 
-    p = Path(request.fspath.dirname) / request.param
-    # Temporaly change the working directory
-    os.chdir(p)
-    # Add p to the path tto be explored, to fake lunching a program fro, the cwd
-    sys.path.insert(0, str(p))
-    yield
-    os.chdir(request.config.invocation_dir)
-    sys.path.pop(0)
-    print(sys.path)
 
-
-@pytest.mark.parametrize("change_test_dir", ["test_custom_session/"], indirect=True)
-def test_session_instanciation(change_test_dir):
+def test_session_instanciation():
     """
     Make sure the session can be instanciated
     """
 
-    import sys
-
     from statisfactory import Session
 
-    sess = Session()
+    sess = Session(root_folder=_TEST_REPO)
 
     assert sess.custom_session_flag == 1  # type: ignore
     assert sess.custom_session_flag_2 == 1  # type: ignore
@@ -43,19 +43,22 @@ from statisfactory.IO import Backend
 #############################################################################
 
 
-@pytest.fixture
+# The test repository, resolved once
+_TEST_REPO = Path(__file__).parent.resolve() / "test_repo"
+
+
+@pytest.fixture(scope="module")
 def sess():
     """
     Create a Stati session
     """
 
-    p = str(Path("tests/test_repo/").absolute())
-    sess = Session(root_folder=p)
+    sess = Session(root_folder=_TEST_REPO)
 
     return sess
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def catalog(sess) -> Catalog:
     """
     Create the Catalog
@@ -87,6 +90,36 @@ def test_read_csv_load_options(catalog: Catalog):
     assert out.index.name == "c"
 
 
+def test_read_csv_pyarrow_engine(catalog: Catalog):
+    """
+    Test that the pandas' pyarrow engine can be selected through the load options
+    """
+
+    out = catalog.load("test_read_csv_options", engine="pyarrow")
+    assert out.equals(catalog.load("test_read_csv_options"))
+
+
+def test_load_many(catalog: Catalog):
+    """
+    Test the concurrent load of several artifacts
+    """
+
+    out = catalog.load_many(["test_read_csv", "test_read_csv_options"])
+
+    assert list(out.keys()) == ["test_read_csv", "test_read_csv_options"]
+    assert out["test_read_csv_options"].equals(catalog.load("test_read_csv_options"))
+
+
+def test_load_many_context(catalog: Catalog):
+    """
+    Test that the context of a concurrent load is forwarded to the artifacts, and does not clash with the pool's options
+    """
+
+    out = catalog.load_many(["test_read_csv_options"], {"index_col": 1}, max_workers=1)
+
+    assert out["test_read_csv_options"].index.name == "b"
+
+
 def test_save_csv_save_options(catalog: Catalog):
     """
     Test the saving of the CSV and the support for options
@@ -165,8 +198,7 @@ def custom_sess():
             flag_holder[1] = True
             return b"1,2,3"
 
-    p = str(Path("tests/test_repo/").absolute())
-    sess = Session(root_folder=p)
+    sess = Session(root_folder=_TEST_REPO)
 
     return sess
 
@@ -30,12 +30,15 @@
 #                                 Packages                                  #
 #############################################################################
 
+import os
 from pathlib import Path
 import pytest
 from statisfactory import Session
+from statisfactory.errors import Errors
 from statisfactory.models import PipelineDefinition, ParametersSetDefinition, MergeMethod
 from statisfactory.loader.parameters_loader import _merge_by_precedence, get_parameters
 from statisfactory.loader.pipelines_loader import get_pipelines
+from statisfactory.loader.pyproject_loader import get_pyproject
 from statisfactory.loader.yaml_utils import gen_as_model
 
 #############################################################################
@@ -43,14 +46,23 @@ from statisfactory.loader.yaml_utils import gen_as_model
 #############################################################################
 
 
-@pytest.fixture
+# The test repository and the loader's fixtures, resolved once
+_TESTS_ROOT = Path(__file__).parent.resolve()
+_TEST_REPO = _TESTS_ROOT / "test_repo"
+_OVERRIDE_DIR = _TESTS_ROOT / "test_loader/parameters/override"
+_MERGE_YAML = _TESTS_ROOT / "test_loader/parameters/merge_data.yaml"
+_NULLABLE_YAML = _TESTS_ROOT / "test_loader/parameters/nullable.yaml"
+_PIPELINES_DIR = _TESTS_ROOT / "test_repo/Pipelines/definitions"
+_PYPROJECT = _TESTS_ROOT / "test_repo/pyproject.toml"
+
+
+@pytest.fixture(scope="module")
 def sess():
     """
     Create a Stati session
     """
 
-    p = str(Path("tests/test_repo/").absolute())
-    sess = Session(root_folder=p)
+    sess = Session(root_folder=_TEST_REPO)
 
     return sess
 
@@ -87,7 +99,7 @@ def test_parameters_precedence():
     Test if the precedence of the parameters set is correctly handled
     """
 
-    p = Path("tests/test_loader/parameters/override/").absolute()
+    p = _OVERRIDE_DIR
 
     models = gen_as_model(path=p, model=ParametersSetDefinition)  # type: ignore
     out = _merge_by_precedence(models)  # type: ignore
@@ -95,12 +107,44 @@ def test_parameters_precedence():
     assert out["cssvdc_parameters"].b == 2
 
 
+def test_gen_as_model_cached(tmp_path):
+    """
+    Test that the models are reused while the yamls are unchanged, and reparsed once a file is modified
+    """
+
+    p = tmp_path / "parameters.yaml"
+    p.write_text("spam:\n  a: 1\n")
+
+    first = dict(gen_as_model(path=p, model=ParametersSetDefinition))  # type: ignore
+    first["spam"].a = 2
+    assert dict(gen_as_model(path=p, model=ParametersSetDefinition))["spam"].a == 1  # type: ignore
+
+    p.write_text("spam:\n  a: 3\n")
+    os.utime(p, ns=(0, 0))
+    assert dict(gen_as_model(path=p, model=ParametersSetDefinition))["spam"].a == 3  # type: ignore
+
+
+def test_gen_as_model_cache_key(tmp_path):
+    """
+    Test that the cache key handles mixed keys, and does not confuse int and str keys
+    """
+
+    p = tmp_path / "parameters.yaml"
+    p.write_text("spam:\n  a: {{ ports[1] }}\n")
+
+    render_vars = {"ports": {1: "x", "b": "c"}}
+    assert dict(gen_as_model(path=p, model=ParametersSetDefinition, render_vars=render_vars))["spam"].a == "x"  # type: ignore
+
+    render_vars = {"ports": {"1": "x", "b": "c"}}
+    assert dict(gen_as_model(path=p, model=ParametersSetDefinition, render_vars=render_vars))["spam"].a is None  # type: ignore
+
+
 def test_get_parameters_inheritance_and_precedence(sess):
     """
     Test if the get_parameters works a as whole
     """
 
-    p = Path("tests/test_loader/parameters/override/").absolute()
+    p = _OVERRIDE_DIR
     params = get_parameters(path=p, session=sess)
 
     assert params["cssvdc_parameters"]["b"] == 2
@@ -112,19 +156,31 @@ def test_get_pipelines(sess):
     Test if pipelines are correctly parsed
     """
 
-    p = Path("tests/test_repo/Pipelines/definitions").absolute()
+    p = _PIPELINES_DIR
     pipelines = get_pipelines(path=p, session=sess)
 
     assert [craft.name for craft in pipelines["multiples_files_pipeline"].crafts] == ["craft_spam"]
     assert [craft.name for craft in pipelines["full"].crafts] == ["craft_foo", "craft_spam"]
 
 
+def test_get_pipelines_circular(sess, tmp_path):
+    """
+    Test that circular pipelines definitions are reported
+    """
+
+    p = tmp_path / "pipelines.yaml"
+    p.write_text("foo:\n  +operators:\n    - spam\nspam:\n  +operators:\n    - foo\n")
+
+    with pytest.raises(Errors.E019):  # type: ignore
+        get_pipelines(path=p, session=sess)
+
+
 def test_merging_strategies(sess):
     """
     Test the recursive and the overriding merge of parameters
     """
 
-    p = Path("tests/test_loader/parameters/merge_data.yaml").absolute()
+    p = _MERGE_YAML
     params = get_parameters(path=p, session=sess)
 
     assert params["inherited_2"] == {"param_1": 1, "param_2": 2, "param_nested": {"param_nested_2": 2}, "tags": []}
@@ -139,7 +195,17 @@ def test_support_for_nul(sess):
     assert sess.settings.value.not_null == 1
     assert sess.settings.value.nullable is None
 
-    p = Path("tests/test_loader/parameters/nullable.yaml").absolute()
+    p = _NULLABLE_YAML
     parameters = get_parameters(path=p, session=sess)
 
     assert parameters["test"]["nullable"] is None
+
+
+def test_pyproject_cached():
+    """
+    Test that an unmodified pyproject.toml is only parsed once
+    """
+
+    p = _PYPROJECT
+
+    assert get_pyproject(p) is get_pyproject(p)
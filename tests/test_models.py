@@ -40,14 +40,17 @@ from statisfactory import Artifact, Craft, Session, Volatile
 #############################################################################
 
 
-@pytest.fixture
+# The test repository, resolved once
+_TEST_REPO = Path(__file__).parent.resolve() / "test_repo"
+
+
+@pytest.fixture(scope="module")
 def sess():
     """
     Create a Stati session
     """
 
-    p = str(Path("tests/test_repo/").absolute())
-    sess = Session(root_folder=p)
+    sess = Session(root_folder=_TEST_REPO)
 
     return sess
 
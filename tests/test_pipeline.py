@@ -41,21 +41,25 @@ from statisfactory import Artifact, Craft, Session, Volatile
 #############################################################################
 
 
-@pytest.fixture
+# The test repository, resolved once
+_TEST_REPO = Path(__file__).parent.resolve() / "test_repo"
+
+
+@pytest.fixture(scope="module")
 def sess():
     """
     Create a Stati session
     """
 
-    p = str(Path("tests/test_repo/").absolute())
-    sess = Session(root_folder=p)
+    sess = Session(root_folder=_TEST_REPO)
 
     return sess
 
 
-def test_linear_pipeline_no_args(sess):
+@pytest.fixture(scope="module")
+def linear_pipeline_no_args():
     """
-    Test the execution of a linear pipeline without any configuration
+    Create a linear pipeline of crafts without any configuration
     """
 
     @Craft()
@@ -70,40 +74,13 @@ def test_linear_pipeline_no_args(sess):
     def step_3(out_2: Volatile) -> Volatile("out_3"):  # type: ignore
         return 3
 
-    p = step_1 + step_2 + step_3
-    with sess:
-        out = p()
-
-    assert out == {"out_1": 1, "out_2": 2, "out_3": 3}
-
-
-def test_linear_pipeline_shared_args(sess):
-    """
-    Test the execution of a linear pipeline with a shared arguments
-    """
-
-    @Craft()
-    def step_1(VALUE) -> Volatile("out_1"):  # type: ignore
-        return VALUE
-
-    @Craft()
-    def step_2(out_1: Volatile, VALUE) -> Volatile("out_2"):  # type: ignore
-        return VALUE
-
-    @Craft()
-    def step_3(out_2: Volatile, VALUE) -> Volatile("out_3"):  # type: ignore
-        return VALUE
-
-    p = step_1 + step_2 + step_3
-    with sess:
-        out = p(VALUE=3)
-
-    assert out == {"out_1": 3, "out_2": 3, "out_3": 3}
+    return step_1 + step_2 + step_3
 
 
-def test_linear_pipeline_namespaced_args(sess):
+@pytest.fixture(scope="module")
+def linear_pipeline_value():
     """
-    Test the execution of a linear pipeline with dispatched arguments
+    Create a linear pipeline of crafts returning their VALUE argument
     """
 
     @Craft()
@@ -118,21 +95,13 @@ def test_linear_pipeline_namespaced_args(sess):
     def step_3(out_2: Volatile, VALUE) -> Volatile("out_3"):  # type: ignore
         return VALUE
 
-    p = step_1 + step_2 + step_3
-    with sess:
-        config = {
-            "test_pipeline.step_1": {"VALUE": 4},
-            "test_pipeline.step_2": {"VALUE": 5},
-            "test_pipeline.step_3": {"VALUE": 6},
-        }
-        out = p(**config)
-
-    assert out == {"out_1": 4, "out_2": 5, "out_3": 6}
+    return step_1 + step_2 + step_3
 
 
-def test_linear_pipeline_namespaced_args_and_shared(sess):
+@pytest.fixture(scope="module")
+def linear_pipeline_value_2():
     """
-    Test the execution of a linear pipeline with both namespaced dispatched arguments and default values
+    Create a linear pipeline of crafts returning the sum of their VALUE and VALUE_2 arguments
     """
 
     @Craft()
@@ -147,21 +116,13 @@ def test_linear_pipeline_namespaced_args_and_shared(sess):
     def step_3(out_2: Volatile, VALUE, VALUE_2) -> Volatile("out_3"):  # type: ignore
         return VALUE + VALUE_2
 
-    p = step_1 + step_2 + step_3
-    with sess:
-        config = {
-            "test_pipeline.step_1": {"VALUE": 4},
-            "test_pipeline.step_2": {"VALUE": 5},
-            "test_pipeline.step_3": {"VALUE": 6},
-        }
-        out = p(**config, VALUE_2=1)
-
-    assert out == {"out_1": 5, "out_2": 6, "out_3": 7}
+    return step_1 + step_2 + step_3
 
 
-def test_linear_pipeline_namespaced_args_and_shared_defaulted(sess):
+@pytest.fixture(scope="module")
+def linear_pipeline_value_2_defaulted():
     """
-    Test the execution of a linear pipeline with both namespaced dispatched arguments and defaulted values
+    Create a linear pipeline of crafts returning the sum of their VALUE and defaulted VALUE_2 arguments
     """
 
     @Craft()
@@ -176,45 +137,59 @@ def test_linear_pipeline_namespaced_args_and_shared_defaulted(sess):
     def step_3(out_2: Volatile, VALUE, VALUE_2=1) -> Volatile("out_3"):  # type: ignore
         return VALUE + VALUE_2
 
-    p = step_1 + step_2 + step_3
+    return step_1 + step_2 + step_3
+
+
+def test_linear_pipeline_no_args(sess, linear_pipeline_no_args):
+    """
+    Test the execution of a linear pipeline without any configuration
+    """
+
     with sess:
-        config = {
-            "test_pipeline.step_1": {"VALUE": 4},
-            "test_pipeline.step_2": {"VALUE": 5},
-            "test_pipeline.step_3": {"VALUE": 6},
-        }
-        out = p(**config, VALUE_2=1)
+        out = linear_pipeline_no_args()
 
-    assert out == {"out_1": 5, "out_2": 6, "out_3": 7}
+    assert out == {"out_1": 1, "out_2": 2, "out_3": 3}
 
 
-def test_linear_pipeline_namespaced_args_and_shared_defaulted_overwritted(sess):
+def test_linear_pipeline_shared_args(sess, linear_pipeline_value):
     """
-    Test the execution of a linear pipeline with both namespaced dispatched arguments and default values overwritted in the shared config
+    Test the execution of a linear pipeline with a shared arguments
     """
 
-    @Craft()
-    def step_1(VALUE, VALUE_2=1) -> Volatile("out_1"):  # type: ignore
-        return VALUE + VALUE_2
+    with sess:
+        out = linear_pipeline_value(VALUE=3)
 
-    @Craft()
-    def step_2(out_1: Volatile, VALUE, VALUE_2=2) -> Volatile("out_2"):  # type: ignore
-        return VALUE + VALUE_2
+    assert out == {"out_1": 3, "out_2": 3, "out_3": 3}
 
-    @Craft()
-    def step_3(out_2: Volatile, VALUE, VALUE_2=1) -> Volatile("out_3"):  # type: ignore
-        return VALUE + VALUE_2
 
-    p = step_1 + step_2 + step_3
+# The arguments dispatched to each one of the linear pipeline's steps
+_NAMESPACED_VALUES = {
+    "test_pipeline.step_1": {"VALUE": 4},
+    "test_pipeline.step_2": {"VALUE": 5},
+    "test_pipeline.step_3": {"VALUE": 6},
+}
+
+
+@pytest.mark.parametrize(
+    "pipeline, shared, expected",
+    [
+        ("linear_pipeline_value", {}, {"out_1": 4, "out_2": 5, "out_3": 6}),
+        ("linear_pipeline_value_2", {"VALUE_2": 1}, {"out_1": 5, "out_2": 6, "out_3": 7}),
+        ("linear_pipeline_value_2_defaulted", {}, {"out_1": 5, "out_2": 7, "out_3": 7}),
+        ("linear_pipeline_value_2_defaulted", {"VALUE_2": 1}, {"out_1": 5, "out_2": 6, "out_3": 7}),
+    ],
+    ids=["namespaced", "namespaced_and_shared", "namespaced_and_defaulted", "namespaced_and_defaulted_overwritted"],
+)
+def test_linear_pipeline_namespaced_args(sess, request, pipeline, shared, expected):
+    """
+    Test the execution of a linear pipeline with namespaced dispatched arguments, combined with shared and defaulted values
+    """
+
+    p = request.getfixturevalue(pipeline)
     with sess:
-        config = {
-            "test_pipeline.step_1": {"VALUE": 4},
-            "test_pipeline.step_2": {"VALUE": 5},
-            "test_pipeline.step_3": {"VALUE": 6},
-        }
-        out = p(**config, VALUE_2=1)
-
-    assert out == {"out_1": 5, "out_2": 6, "out_3": 7}
+        out = p(**_NAMESPACED_VALUES, **shared)
+
+    assert out == expected
 
 
 def test_variadic_artifact_interpolation_dispatching(sess):
@@ -41,19 +41,22 @@ from statisfactory import Session, Volatile, Craft
 #############################################################################
 
 
-@pytest.fixture
+# The test repository, resolved once
+_TEST_REPO = Path(__file__).parent.resolve() / "test_repo"
+
+
+@pytest.fixture(scope="module")
 def sess():
     """
     Create a Stati session
     """
 
-    p = str(Path("tests/test_repo/").absolute())
-    sess = Session(root_folder=p)
+    sess = Session(root_folder=_TEST_REPO)
 
     return sess
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_pipeline():
     """
     Create a simple pipeline
@@ -76,10 +79,11 @@ def sample_pipeline():
 
 def test_smoketest_config_loaded(sess):
     """
-    make sure that config are parsed and loaded
+    make sure that config are parsed and loaded, once
     """
 
     assert bool(sess.parameters)
+    assert sess.parameters is sess.parameters
 
 
 def test_base_configuration(sess):
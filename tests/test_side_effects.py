@@ -30,43 +30,32 @@
 #                                 Packages                                  #
 #############################################################################
 
-import os
 import sys
-import pytest
+from collections import defaultdict
 from pathlib import Path
-import sys
 
 #############################################################################
 #                                  Scripts                                  #
 #############################################################################
-@pytest.fixture
-def change_test_dir(request):
-    """
-    Change the working directory of the test
-    """
 
-    p = Path(request.fspath.dirname) / request.param
-    # Temporaly change the working directory
-    os.chdir(p)
-    # Add p to the path tto be explored, to fake lunching a program fro, the cwd
-    sys.path.insert(0, str(p))
-    yield
-    os.chdir(request.config.invocation_dir)
-    sys.path.pop(0)
-    print(sys.path)
 
+# The test repository, resolved once
+_TEST_REPO = Path(__file__).parent.resolve() / "test_custom_session_side_effects_only"
 
-@pytest.mark.parametrize("change_test_dir", ["test_custom_session_side_effects_only/"], indirect=True)
-def _test_sides_effect_only(change_test_dir):
+
+def test_sides_effect_only(monkeypatch):
     """
     Check if specifiying an entrypoint apply side effects.
     """
 
-    del sys.modules["Session"]
     from statisfactory import Session
+    from statisfactory.session import BaseSession
 
-    sess = Session()
+    # The cli test repository ships its own 'side' entrypoint : import this repository's one, and restore the previous state afterward
+    monkeypatch.setitem(sys.modules, "side", None)
+    monkeypatch.delitem(sys.modules, "side")
+    monkeypatch.setattr(BaseSession, "_hooks", defaultdict(tuple, BaseSession._hooks))
 
-    assert sess.side_only_flag == 1  # type: ignore
+    sess = Session(root_folder=_TEST_REPO)
 
-    sys.modules = base_modules
+    assert sess.side_only_flag == 1  # type: ignore
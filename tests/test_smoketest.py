@@ -30,6 +30,14 @@
 #                                 Packages                                  #
 #############################################################################
 
+from pathlib import Path
+
+import pytest
+
+#############################################################################
+#                                  Script                                   #
+#############################################################################
+
 
 def test_import():
     """
@@ -38,23 +46,13 @@ def test_import():
     from statisfactory import Session
 
 
-def test_session_instanciation():
+@pytest.mark.parametrize("root", ["test_repo", "test_repo_yml"])
+def test_session_instanciation(root):
     """
-    Make sure the session can be instanciated
+    Make sure the session can be instanciated, with either .yaml or .yml configuration files
     """
 
-    from pathlib import Path
-
-    from statisfactory import Session
-
-    p = str(Path("tests/test_repo/").absolute())
-    sess = Session(root_folder=p)
-
-
-def test_config_yml():
-    from pathlib import Path
-
     from statisfactory import Session
 
-    p = str(Path("tests/test_repo_yml/").absolute())
+    p = str(Path(__file__).parent.resolve() / root)
     sess = Session(root_folder=p)